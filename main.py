@@ -3,28 +3,53 @@ Main orchestrator for the AI Travel Agent.
 Demonstrates and tests the flight search, IATA lookup, and POI search tools.
 """
 
+from __future__ import annotations
+
+import asyncio
+import logging
 import os
 import json
+import orjson
+import re
+import sys
+from datetime import date
 from dotenv import load_dotenv
 from typing import Dict, List, Any
 
-# Import tools
-from tools.logistic_tools import FlightSearchTool, CityToIATATool, POISearchTool
-from core.pydantics import ItineraryPlan, FlightOption
 
 # Load environment variables
 load_dotenv()
 
+# Matches exactly 3 uppercase letters (an IATA code); compiled once at import
+_IATA_RE = re.compile(r'\b([A-Z]{3})\b')
+
+# Single buffered handler instead of one unbuffered write per print();
+# configured in main() via logging.basicConfig
+logger = logging.getLogger("travel")
+
 
 class TravelAgentOrchestrator:
     """Orchestrates the travel planning workflow using individual tools."""
     
     def __init__(self):
-        """Initialize all available tools."""
-        self.flight_search_tool = FlightSearchTool()
-        self.iata_lookup_tool = CityToIATATool()
-        self.poi_search_tool = POISearchTool()
+        """Initialize all available tools (shared module-level singletons)."""
+        # Imported here so the CLI menu renders before LangChain's heavy
+        # import chain runs; the singletons make repeat construction free
+        from tools.logistic_tools import FLIGHT_TOOL, IATA_TOOL, POI_TOOL
+        self.flight_search_tool = FLIGHT_TOOL
+        self.iata_lookup_tool = IATA_TOOL
+        self.poi_search_tool = POI_TOOL
         
+    @staticmethod
+    async def _with_http_cleanup(coro):
+        """Awaits coro, closing the per-loop HTTP client before asyncio.run
+        tears the loop down so pooled connections never outlive it."""
+        from tools.logistic_tools import aclose_async_client
+        try:
+            return await coro
+        finally:
+            await aclose_async_client()
+
     def lookup_iata_code(self, city_name: str) -> str:
         """
         Step 1: Look up the IATA code for a city.
@@ -35,11 +60,11 @@ class TravelAgentOrchestrator:
         Returns:
             IATA code (e.g., 'JFK', 'LHR')
         """
-        print(f"\n[STEP 1] Looking up IATA code for: {city_name}")
-        print("-" * 50)
+        logger.info(f"\n[STEP 1] Looking up IATA code for: {city_name}")
+        logger.info("-" * 50)
         
-        result = self.iata_lookup_tool._run(city_name=city_name)
-        print(f"Result: {result}")
+        result = self.iata_lookup_tool._run_impl(city_name)
+        logger.info(f"Result: {result}")
         
         return result
     
@@ -57,38 +82,47 @@ class TravelAgentOrchestrator:
         Returns:
             List of flight options
         """
-        print(f"\n[STEP 2] Searching for flights")
-        print("-" * 50)
-        print(f"Route: {departure_city} → {arrival_city}")
-        print(f"Dates: {start_date} to {end_date}")
+        return asyncio.run(self._with_http_cleanup(self.search_flights_async(
+            departure_city, arrival_city, start_date, end_date)))
+
+    async def search_flights_async(self, departure_city: str, arrival_city: str,
+                                   start_date: str, end_date: str) -> List[Dict[str, Any]]:
+        """Async core of search_flights; runs on the shared event loop."""
+        logger.info(f"\n[STEP 2] Searching for flights")
+        logger.info("-" * 50)
+        logger.info(f"Route: {departure_city} → {arrival_city}")
+        logger.info(f"Dates: {start_date} to {end_date}")
         
-        # Get IATA codes
-        departure_iata = self._extract_iata_code(self.lookup_iata_code(departure_city))
-        arrival_iata = self._extract_iata_code(self.lookup_iata_code(arrival_city))
+        # Get IATA codes - batched so the pair costs at most one web search
+        logger.info(f"\n[STEP 1] Looking up IATA codes for: {departure_city}, {arrival_city}")
+        logger.info("-" * 50)
+        dep_result, arr_result = await self.iata_lookup_tool._arun_pair(departure_city, arrival_city)
+        departure_iata = self._extract_iata_code(dep_result)
+        arrival_iata = self._extract_iata_code(arr_result)
         
         if not departure_iata or not arrival_iata:
-            print("❌ Failed to obtain valid IATA codes")
+            logger.info("❌ Failed to obtain valid IATA codes")
             return []
         
-        print(f"\nDeparture IATA: {departure_iata}")
-        print(f"Arrival IATA: {arrival_iata}")
+        logger.info(f"\nDeparture IATA: {departure_iata}")
+        logger.info(f"Arrival IATA: {arrival_iata}")
         
-        # Search flights
-        result = self.flight_search_tool._run(
+        # Search flights over the shared async HTTP client
+        result = await self.flight_search_tool._arun(
             departure_iata=departure_iata,
             arrival_iata=arrival_iata,
             start_date=start_date,
             end_date=end_date
         )
         
-        print(f"\nFlight Search Result: {result}")
+        logger.info(f"\nFlight Search Result: {result}")
         
         # Parse result
         try:
             flights = json.loads(result)
             return flights
         except json.JSONDecodeError:
-            print(f"Note: {result}")
+            logger.info(f"Note: {result}")
             return []
     
     def _extract_iata_code(self, result: str) -> str:
@@ -101,11 +135,30 @@ class TravelAgentOrchestrator:
         Returns:
             3-letter IATA code or empty string if not found
         """
-        import re
-        # Match exactly 3 uppercase letters
-        match = re.search(r'\b([A-Z]{3})\b', result.strip().upper())
+        match = _IATA_RE.search(result.strip().upper())
         return match.group(1) if match else ""
-    
+
+    @staticmethod
+    def _daily_plan_entry(day_index: int, trip_duration: int, arrival_city: str) -> str:
+        """
+        Build the plan entry for one day of the trip.
+
+        Args:
+            day_index: Zero-based day number
+            trip_duration: Total trip length in days
+            arrival_city: Destination city name
+
+        Returns:
+            Plan description for that day
+        """
+        if day_index == 0:
+            return f"Arrive in {arrival_city}, check-in, rest and explore nearby areas"
+        if day_index == trip_duration - 1:
+            return "Last-minute sightseeing and departure preparation"
+        if day_index == trip_duration - 2 and trip_duration > 3:
+            return "Shopping and local cuisine exploration"
+        return "Visit major attractions and landmarks"
+
     def search_poi(self, city_name: str) -> str:
         """
         Step 3: Search for points of interest and activities.
@@ -116,11 +169,15 @@ class TravelAgentOrchestrator:
         Returns:
             POI search results
         """
-        print(f"\n[STEP 3] Searching for Points of Interest in: {city_name}")
-        print("-" * 50)
+        return asyncio.run(self._with_http_cleanup(self.search_poi_async(city_name)))
+
+    async def search_poi_async(self, city_name: str) -> str:
+        """Async core of search_poi; runs on the shared event loop."""
+        logger.info(f"\n[STEP 3] Searching for Points of Interest in: {city_name}")
+        logger.info("-" * 50)
         
-        result = self.poi_search_tool._run(city_name=city_name)
-        print(f"Result:\n{result}")
+        result = await self.poi_search_tool._arun(city_name)
+        logger.info(f"Result:\n{result}")
         
         return result
     
@@ -138,51 +195,64 @@ class TravelAgentOrchestrator:
         Returns:
             Structured ItineraryPlan
         """
-        print("\n" + "=" * 60)
-        print("🌍 AI TRAVEL AGENT - COMPLETE TRIP PLANNER")
-        print("=" * 60)
-        
-        # Step 1: Search flights
-        flights = self.search_flights(departure_city, arrival_city, start_date, end_date)
+        return asyncio.run(self._with_http_cleanup(self._plan_trip_async(
+            departure_city, arrival_city, start_date, end_date)))
+
+    async def _plan_trip_async(self, departure_city: str, arrival_city: str,
+                               start_date: str, end_date: str) -> ItineraryPlan:
+        logger.info("\n" + "=" * 60)
+        logger.info("🌍 AI TRAVEL AGENT - COMPLETE TRIP PLANNER")
+        logger.info("=" * 60)
         
-        # Step 2: Search POIs
-        poi_info = self.search_poi(arrival_city)
+        # Steps 1 & 2: the POI search only depends on the arrival city, so
+        # run it concurrently with the flight search on the event loop
+        poi_task = asyncio.create_task(self.search_poi_async(arrival_city))
+        flights = await self.search_flights_async(departure_city, arrival_city, start_date, end_date)
+        poi_info = await poi_task
         
         # Step 3: Create structured itinerary
-        print(f"\n[STEP 4] Creating structured itinerary plan")
-        print("-" * 50)
+        logger.info(f"\n[STEP 4] Creating structured itinerary plan")
+        logger.info("-" * 50)
         
         # Convert flight results to FlightOption objects
+        from core.pydantics import FlightOption, ItineraryPlan
+
         flight_options = []
         if flights:
             for flight in flights[:3]:  # Take top 3
+                # model_construct skips validation; the dicts come from our
+                # own FlightSearchTool output, so they are already trusted
                 flight_options.append(
-                    FlightOption(
+                    FlightOption.model_construct(
                         price_usd=flight.get('price_usd', 'N/A'),
                         airline_code=flight.get('airline_code', 'N/A'),
                         duration=flight.get('duration', 'N/A')
                     )
                 )
         
-        # Create sample daily plan
-        trip_duration = (end_date - start_date).days if isinstance(start_date, str) else 7
+        # Create a daily plan sized to the actual trip length. The dates are
+        # parsed once; malformed input falls back to a 7-day plan.
+        try:
+            trip_duration = (date.fromisoformat(end_date) - date.fromisoformat(start_date)).days
+        except ValueError:
+            trip_duration = 7
+        trip_duration = max(trip_duration, 1)
+
         daily_plan = {
-            "Day 1": f"Arrive in {arrival_city}, check-in, rest and explore nearby areas",
-            "Day 2-5": "Visit major attractions and landmarks",
-            "Day 6": "Shopping and local cuisine exploration",
-            "Day 7": "Last-minute sightseeing and departure preparation"
+            f"Day {i + 1}": self._daily_plan_entry(i, trip_duration, arrival_city)
+            for i in range(trip_duration)
         }
         
-        # Construct itinerary
-        itinerary = ItineraryPlan(
+        # Construct itinerary (all fields built in-process, skip validation)
+        itinerary = ItineraryPlan.model_construct(
             destination=arrival_city,
             travel_dates=f"{start_date} to {end_date}",
             flights=flight_options,
-            poi_summary=poi_info[:500] + "..." if len(poi_info) > 500 else poi_info,
+            poi_summary=poi_info,  # already truncated inside POISearchTool
             daily_plan=daily_plan
         )
         
-        print("\n✅ Itinerary created successfully!")
+        logger.info("\n✅ Itinerary created successfully!")
         return itinerary
 
 
@@ -232,13 +302,13 @@ def test_complete_workflow():
     print("\n" + "=" * 60)
     print("📋 FINAL ITINERARY")
     print("=" * 60)
-    print(itinerary.model_dump_json(indent=2))
+    print(orjson.dumps(itinerary.model_dump(mode='json'), option=orjson.OPT_INDENT_2).decode())
 
 
 def main():
     """Main entry point for the travel agent."""
-    import sys
-    
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+
     print("\n🚀 AI TRAVEL AGENT INITIALIZED")
     print("Choose a test mode:")
     print("1. Test individual tools")
@@ -263,7 +333,7 @@ def main():
         print("\n" + "=" * 60)
         print("📋 YOUR TRAVEL ITINERARY")
         print("=" * 60)
-        print(itinerary.model_dump_json(indent=2))
+        print(orjson.dumps(itinerary.model_dump(mode='json'), option=orjson.OPT_INDENT_2).decode())
     else:
         print("Invalid choice. Running default test...")
         test_complete_workflow()
@@ -1,36 +1,374 @@
+import asyncio
+import functools
 import os
+import re
 import requests
+import threading
+import time
 from dotenv import load_dotenv
+from itertools import islice
 import json
+import orjson
 from typing import Type
 
 # --- Core Imports ---
+import httpx
+from diskcache import Cache
 from langchain.tools import BaseTool
-from tavily import TavilyClient
 
 from core.pydantics import FlightSearchInput, IATALookupInput
 
 # Load environment variables
 load_dotenv()
 
+# Matches a 3-letter IATA code like "JFK", "LHR", "CDG"; compiled once
+# instead of re-parsing the pattern on every lookup
+_IATA_RE = re.compile(r'\b([A-Z]{3})\b')
+
+# Formats ISO-8601 durations like "PT10H30M" as "10h 30m" in a single pass
+# over the string rather than three chained str.replace calls
+_DUR_RE = re.compile(r'PT|[HM]')
+_DUR_MAP = {'PT': '', 'H': 'h ', 'M': 'm'}
+
+def _format_duration(duration: str) -> str:
+    """Converts an ISO-8601 duration (e.g. 'PT10H30M') to '10h 30m'."""
+    return _DUR_RE.sub(lambda m: _DUR_MAP[m.group(0)], duration)
+
+# --- Shared HTTP session ---
+# A single Session reuses the TLS session and HTTP keep-alive connection
+# across the token POST and the flight-offers GET, instead of paying a
+# fresh TCP+TLS handshake per request. Retries cover transient Amadeus
+# rate-limit/server errors.
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=requests.adapters.Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+))
+# Responses compress well (JSON); make the negotiation explicit
+_SESSION.headers['Accept-Encoding'] = 'gzip'
+
+# (connect, read) timeouts for all Amadeus calls
+_HTTP_TIMEOUT = (3, 10)
+
+# Async counterpart of _SESSION for the _arun paths. The orchestrator's
+# sync wrappers call asyncio.run, which builds a fresh event loop per call,
+# and httpx connections cannot outlive the loop they were opened on — so
+# clients are keyed by the running loop (HTTP/2 still multiplexes the token
+# and flight-offers calls within one run) and must be closed via
+# aclose_async_client() before that loop shuts down.
+_ASYNC_CLIENTS = {}
+
+def _get_async_client() -> "httpx.AsyncClient":
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=True,
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=8),
+            headers={'Accept-Encoding': 'gzip'},
+        )
+        _ASYNC_CLIENTS[loop] = client
+    return client
+
+async def aclose_async_client() -> None:
+    """Closes the running loop's shared client; call before the loop exits."""
+    client = _ASYNC_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+# --- Bundled airport dataset (city -> IATA) ---
+# Loaded once at import time so city->IATA resolution is an O(1) dict lookup
+# instead of a Tavily web search. Tavily remains as a fallback for cities
+# missing from the bundled dataset, and successful fallback lookups are
+# memoized back into the index.
+_AIRPORTS_PATH = os.path.join(os.path.dirname(__file__), "airports.json")
+
+def _load_airport_index():
+    """
+    Builds the in-memory city->IATA indexes from the bundled airports.json.
+
+    Returns:
+        A tuple (city_index, city_country_index):
+        - city_index: keyed by lowercased city name (first entry wins for
+          ambiguous cities, e.g. 'London' -> 'LHR')
+        - city_country_index: keyed by 'city, country' for disambiguation
+    """
+    with open(_AIRPORTS_PATH, encoding='utf-8') as f:
+        airports = json.load(f)
+
+    city_index = {}
+    city_country_index = {}
+    for airport in airports:
+        city_key = airport['city'].strip().lower()
+        city_index.setdefault(city_key, airport['iata'])
+        country_key = f"{city_key}, {airport['country'].strip().lower()}"
+        city_country_index[country_key] = airport['iata']
+
+    return city_index, city_country_index
+
+# Module-level singleton shared by all tool instances
+_CITY_INDEX, _CITY_COUNTRY_INDEX = _load_airport_index()
+
+# Persistent cross-run cache for web lookup results. The in-memory layers
+# (airport index, lru_cache) stay in front for per-process speed; this one
+# makes previously-seen cities survive process restarts.
+_CACHE = Cache(os.path.join(os.path.dirname(__file__), os.pardir, '.cache', 'travel'))
+_CACHE_TTL = 86400 * 30  # 30 days
+
+def _find_iata_fast(content: str) -> str:
+    """
+    Cheap str.find scan for '(LHR)'-style codes in a search snippet.
+
+    Tavily results almost always carry the IATA code in parentheses, so this
+    plain string scan resolves the common case without dispatching the regex
+    engine over a potentially large content body. Returns '' on miss.
+    """
+    i = content.find('(')
+    while i != -1:
+        candidate = content[i + 1:i + 4]
+        if candidate.isalpha() and candidate.isupper() and content[i + 4:i + 5] == ')':
+            return candidate
+        i = content.find('(', i + 1)
+    return ""
+
+def _iata_lookup(city_normalized: str) -> str:
+    """
+    Resolves a normalized (stripped, casefolded) city name to an IATA code.
+
+    Returns the failure message as a string on miss, like the tools do, but
+    keeps failures out of the LRU layer so a transient Tavily error does not
+    poison the city for the rest of the session.
+    """
+    try:
+        return _iata_lookup_cached(city_normalized)
+    except LookupError as e:
+        return str(e)
+
+@functools.lru_cache(maxsize=2048)
+def _iata_lookup_cached(city_normalized: str) -> str:
+    """
+    Cached lookup core: index first, then Tavily. Only successful
+    resolutions return (and are memoized); failures raise LookupError so
+    lru_cache never stores them.
+    """
+    # Fast path: resolve from the bundled airport index (no network call).
+    # Accepts plain city names ('paris') and 'city, country' forms.
+    iata_code = _CITY_COUNTRY_INDEX.get(city_normalized) or _CITY_INDEX.get(city_normalized)
+    if iata_code:
+        return iata_code
+
+    # Disk cache: previously-resolved cities survive process restarts
+    iata_code = _CACHE.get(f"iata:{city_normalized}")
+    if iata_code:
+        _CITY_INDEX[city_normalized] = iata_code
+        return iata_code
+
+    # Slow path: fall back to a Tavily web search for unknown cities.
+    # Imported here so the module loads without paying for the client
+    from tavily import TavilyClient
+    tavily = TavilyClient(api_key=os.getenv('TAVILY_API_KEY'))
+    if not tavily.api_key:
+         raise LookupError("TAVILY_API_KEY is missing. Cannot perform IATA lookup.")
+
+    try:
+        query = f"IATA airport code {city_normalized}"
+        search_result = tavily.search(query=query, search_depth='basic', max_results=1)
+    except Exception as e:
+        raise LookupError(f"Error during IATA lookup: {e}")
+
+    if search_result['results'] and search_result['results'][0]['content']:
+        content = search_result['results'][0]['content']
+
+        # Extract 3-letter IATA code from the content: try the cheap
+        # parenthesized-code scan first, regex only on miss
+        iata_code = _find_iata_fast(content)
+        if not iata_code:
+            iata_match = _IATA_RE.search(content)
+            iata_code = iata_match.group(1) if iata_match else ""
+
+        if iata_code:
+            # Memoize so repeat lookups for this city skip Tavily
+            _CITY_INDEX[city_normalized] = iata_code
+            _CACHE.set(f"iata:{city_normalized}", iata_code, expire=_CACHE_TTL)
+            return iata_code
+
+        raise LookupError(f"Could not extract IATA code from search results for {city_normalized}.")
+
+    raise LookupError(f"Could not find IATA code for {city_normalized} via search.")
+
+def _iata_lookup_pair(dep_normalized: str, arr_normalized: str) -> tuple:
+    """
+    Resolves two normalized city names to IATA codes with at most one
+    Tavily query.
+
+    Cities found in the bundled index are answered locally; only when both
+    miss do we issue a single combined search and split the matches by their
+    position relative to each city mention. Falls back to individual
+    lookups whenever the combined result is ambiguous.
+    """
+    dep_code = _CITY_COUNTRY_INDEX.get(dep_normalized) or _CITY_INDEX.get(dep_normalized)
+    arr_code = _CITY_COUNTRY_INDEX.get(arr_normalized) or _CITY_INDEX.get(arr_normalized)
+
+    # Disk layer: cities resolved in earlier runs must not trigger another
+    # web search just because this process started cold
+    if not dep_code:
+        dep_code = _CACHE.get(f"iata:{dep_normalized}")
+        if dep_code:
+            _CITY_INDEX[dep_normalized] = dep_code
+    if not arr_code:
+        arr_code = _CACHE.get(f"iata:{arr_normalized}")
+        if arr_code:
+            _CITY_INDEX[arr_normalized] = arr_code
+
+    if not (dep_code and arr_code):
+        if dep_code or arr_code:
+            # Only one city missed the index; a single lookup covers it
+            dep_code = dep_code or _iata_lookup(dep_normalized)
+            arr_code = arr_code or _iata_lookup(arr_normalized)
+        else:
+            dep_code, arr_code = _iata_lookup_pair_remote(dep_normalized, arr_normalized)
+
+    return dep_code, arr_code
+
+def _iata_lookup_pair_remote(dep_normalized: str, arr_normalized: str) -> tuple:
+    """One combined Tavily query for both cities; splits matches positionally."""
+    from tavily import TavilyClient
+    tavily = TavilyClient(api_key=os.getenv('TAVILY_API_KEY'))
+    if tavily.api_key:
+        try:
+            query = f"IATA airport codes for {dep_normalized} and {arr_normalized}"
+            search_result = tavily.search(query=query, search_depth='basic', max_results=1)
+
+            if search_result['results'] and search_result['results'][0]['content']:
+                content = search_result['results'][0]['content']
+                dep_code = _code_near_city(content, dep_normalized)
+                arr_code = _code_near_city(content, arr_normalized)
+
+                if dep_code and arr_code:
+                    _CITY_INDEX[dep_normalized] = dep_code
+                    _CITY_INDEX[arr_normalized] = arr_code
+                    _CACHE.set(f"iata:{dep_normalized}", dep_code, expire=_CACHE_TTL)
+                    _CACHE.set(f"iata:{arr_normalized}", arr_code, expire=_CACHE_TTL)
+                    return dep_code, arr_code
+        except Exception:
+            pass
+
+    # Combined query failed or was ambiguous; do the two individual lookups
+    return _iata_lookup(dep_normalized), _iata_lookup(arr_normalized)
+
+def _code_near_city(content: str, city_normalized: str) -> str:
+    """Returns the first IATA-shaped match at or after the city mention."""
+    # Locate the city case-insensitively in the original string: indexing
+    # into a casefolded copy would skew the offset whenever casefolding
+    # changes the length (e.g. 'ß' -> 'ss')
+    city_match = re.search(re.escape(city_normalized), content, re.IGNORECASE)
+    if not city_match:
+        return ""
+    match = _IATA_RE.search(content, city_match.start())
+    return match.group(1) if match else ""
+
+# Cached Amadeus OAuth token. Tokens are valid ~30 minutes; we reuse the
+# cached one until 60 seconds before expiry instead of POSTing to the
+# oauth2 endpoint on every flight search.
+_TOKEN_CACHE = {"token": None, "exp": 0.0}
+_TOKEN_LOCK = threading.Lock()
+
 def get_amadeus_token() -> str:
     """
-    Retrieves a new Amadeus access token for the test environment.
+    Retrieves an Amadeus access token for the test environment, reusing a
+    cached token until shortly before its expiry.
     Handles API configuration using environment variables.
     """
+    with _TOKEN_LOCK:
+        if _TOKEN_CACHE["token"] and time.time() < _TOKEN_CACHE["exp"] - 60:
+            return _TOKEN_CACHE["token"]
+
+        url = "https://test.api.amadeus.com/v1/security/oauth2/token"
+        data = {
+            'grant_type': 'client_credentials',
+            'client_id': os.getenv('AMADEUS_CLIENT_ID'),
+            'client_secret': os.getenv('AMADEUS_CLIENT_SECRET')
+        }
+
+        if not data['client_id'] or not data['client_secret']:
+            raise ValueError("AMADEUS_CLIENT_ID or AMADEUS_CLIENT_SECRET not set in .env file.")
+
+        response = _SESSION.post(url, data=data, timeout=_HTTP_TIMEOUT)
+        response.raise_for_status()
+        payload = response.json()
+
+        _TOKEN_CACHE["token"] = payload['access_token']
+        _TOKEN_CACHE["exp"] = time.time() + payload.get('expires_in', 0)
+        return _TOKEN_CACHE["token"]
+
+async def aget_amadeus_token() -> str:
+    """Async variant of get_amadeus_token sharing the same token cache."""
+    with _TOKEN_LOCK:
+        if _TOKEN_CACHE["token"] and time.time() < _TOKEN_CACHE["exp"] - 60:
+            return _TOKEN_CACHE["token"]
+
     url = "https://test.api.amadeus.com/v1/security/oauth2/token"
     data = {
         'grant_type': 'client_credentials',
         'client_id': os.getenv('AMADEUS_CLIENT_ID'),
         'client_secret': os.getenv('AMADEUS_CLIENT_SECRET')
     }
-    
+
     if not data['client_id'] or not data['client_secret']:
         raise ValueError("AMADEUS_CLIENT_ID or AMADEUS_CLIENT_SECRET not set in .env file.")
 
-    response = requests.post(url, data=data)
+    response = await _get_async_client().post(url, data=data)
     response.raise_for_status()
-    return response.json()['access_token']
+    payload = response.json()
+
+    with _TOKEN_LOCK:
+        _TOKEN_CACHE["token"] = payload['access_token']
+        _TOKEN_CACHE["exp"] = time.time() + payload.get('expires_in', 0)
+        return _TOKEN_CACHE["token"]
+
+
+_FLIGHT_OFFERS_URL = "https://test.api.amadeus.com/v2/shopping/flight-offers"
+
+def _flight_search_params(departure_iata: str, arrival_iata: str,
+                          start_date: str, end_date: str) -> dict:
+    """Builds the flight-offers query params shared by _run_impl and _arun."""
+    return {
+        'originLocationCode': departure_iata.upper(),
+        'destinationLocationCode': arrival_iata.upper(),
+        'departureDate': start_date,
+        'returnDate': end_date,
+        'adults': 1,
+        'max': 3,
+        'currencyCode': 'USD'
+    }
+
+def _summarize_offers(content: bytes) -> str:
+    """Parses a flight-offers payload and returns the trimmed offers JSON."""
+    # orjson parses the flight-offers payload (tens of KB) several
+    # times faster than the stdlib json used by response.json()
+    data = orjson.loads(content)
+
+    # itin0 is bound once per offer (dict values evaluate in key order), so
+    # the ['itineraries'][0] chain is not re-walked for the duration field
+    offers = [
+        {
+            "price_usd": offer['price']['total'],
+            "airline_code": (itin0 := offer['itineraries'][0])['segments'][0]['carrierCode'],
+            "duration": _format_duration(itin0['duration']),
+        }
+        for offer in islice(data.get('data', ()), 3)
+    ]
+
+    if not offers:
+        return "No real-time flight offers found for the specified criteria. The LLM should proceed to the next planning step."
+
+    return orjson.dumps(offers).decode()
 
 
 class FlightSearchTool(BaseTool):
@@ -39,51 +377,43 @@ class FlightSearchTool(BaseTool):
     args_schema: Type[FlightSearchInput] = FlightSearchInput
 
     def _run(self, departure_iata: str, arrival_iata: str, start_date: str, end_date: str) -> str:
-        
+        return self._run_impl(departure_iata, arrival_iata, start_date, end_date)
+
+    def _run_impl(self, departure_iata: str, arrival_iata: str, start_date: str, end_date: str) -> str:
+        """Tool body, callable directly to skip the framework's args_schema validation."""
         try:
             token = get_amadeus_token()
         except Exception as e:
             return f"Error obtaining Amadeus token: {str(e)}"
 
-        url = "https://test.api.amadeus.com/v2/shopping/flight-offers"
+        params = _flight_search_params(departure_iata, arrival_iata, start_date, end_date)
         headers = {'Authorization': f'Bearer {token}'}
-        
-        params = {
-            'originLocationCode': departure_iata.upper(),
-            'destinationLocationCode': arrival_iata.upper(),
-            'departureDate': start_date,
-            'returnDate': end_date,
-            'adults': 1,
-            'max': 3,
-            'currencyCode': 'USD'
-        }
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = _SESSION.get(_FLIGHT_OFFERS_URL, headers=headers, params=params, timeout=_HTTP_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
-            
-            offers = []
-            if 'data' in data:
-                for offer in data['data']:
-                    price = offer['price']['total']
-                    airline_code = offer['itineraries'][0]['segments'][0]['carrierCode']
-                    duration = offer['itineraries'][0]['duration'].replace('PT', '').replace('H', 'h ').replace('M', 'm')
-                    
-                    offers.append({
-                        "price_usd": price,
-                        "airline_code": airline_code,
-                        "duration": duration,
-                    })
-
-            if not offers:
-                return "No real-time flight offers found for the specified criteria. The LLM should proceed to the next planning step."
-            
-            return json.dumps(offers)
+            return _summarize_offers(response.content)
 
         except requests.exceptions.RequestException as e:
             return f"Amadeus API Request Failed: {e}"
 
+    async def _arun(self, departure_iata: str, arrival_iata: str, start_date: str, end_date: str) -> str:
+        try:
+            token = await aget_amadeus_token()
+        except Exception as e:
+            return f"Error obtaining Amadeus token: {str(e)}"
+
+        params = _flight_search_params(departure_iata, arrival_iata, start_date, end_date)
+        headers = {'Authorization': f'Bearer {token}'}
+
+        try:
+            response = await _get_async_client().get(_FLIGHT_OFFERS_URL, headers=headers, params=params)
+            response.raise_for_status()
+            return _summarize_offers(response.content)
+
+        except httpx.HTTPError as e:
+            return f"Amadeus API Request Failed: {e}"
+
 
 # 2. City to IATA Tool (Uses Tavily Search)
 class CityToIATATool(BaseTool):
@@ -92,53 +422,123 @@ class CityToIATATool(BaseTool):
     args_schema: Type[IATALookupInput] = IATALookupInput
     
     def _run(self, city_name: str) -> str:
-        tavily = TavilyClient(api_key=os.getenv('TAVILY_API_KEY'))
-        if not tavily.api_key:
-             return "TAVILY_API_KEY is missing. Cannot perform IATA lookup."
+        return self._run_impl(city_name)
 
-        try:
-            query = f"IATA airport code {city_name}"
-            search_result = tavily.search(query=query, search_depth='basic', max_results=1)
-            
-            if search_result['results'] and search_result['results'][0]['content']:
-                content = search_result['results'][0]['content']
-                
-                # Extract 3-letter IATA code from the content
-                # Look for patterns like "JFK", "LHR", "CDG" (3 consecutive uppercase letters)
-                import re
-                iata_match = re.search(r'\b([A-Z]{3})\b', content)
-                
-                if iata_match:
-                    iata_code = iata_match.group(1)
-                    return iata_code
-                
-                return f"Could not extract IATA code from search results for {city_name}."
-            
-            return f"Could not find IATA code for {city_name} via search."
-        
-        except Exception as e:
-            return f"Error during IATA lookup: {e}"
+    def _run_impl(self, city_name: str) -> str:
+        """Tool body, callable directly to skip the framework's args_schema validation."""
+        return _iata_lookup(city_name.strip().casefold())
+
+    async def _arun(self, city_name: str) -> str:
+        key = city_name.strip().casefold()
+        # Index/cache hits resolve inline; only a Tavily miss blocks, and
+        # that runs in a worker thread so the event loop stays free
+        iata_code = _CITY_COUNTRY_INDEX.get(key) or _CITY_INDEX.get(key)
+        if iata_code:
+            return iata_code
+        return await asyncio.to_thread(_iata_lookup, key)
+
+    async def _arun_pair(self, departure_city: str, arrival_city: str) -> tuple:
+        """Async wrapper for _run_pair; Tavily misses run in a worker thread."""
+        return await asyncio.to_thread(
+            self._run_pair, departure_city, arrival_city
+        )
+
+    def _run_pair(self, departure_city: str, arrival_city: str) -> tuple:
+        """
+        Resolves a departure/arrival city pair in one shot.
+
+        Issues at most one web search for the pair instead of one per city;
+        returns a (departure_iata, arrival_iata) tuple.
+        """
+        return _iata_lookup_pair(
+            departure_city.strip().casefold(),
+            arrival_city.strip().casefold(),
+        )
+
+
+# Bump when the POI query prompt changes so stale cached summaries are not
+# reused across versions
+_POI_PROMPT_VERSION = 'v1'
+
+# Cap on the POI summary body; matches what the itinerary keeps
+_POI_SUMMARY_LIMIT = 512
+
+def _poi_search(city_normalized: str, prompt_version: str) -> str:
+    """
+    Fetches POI summaries for a normalized city name via Tavily.
+
+    Failure messages are returned as strings but never memoized, so a
+    transient search error does not stick for the rest of the session.
+    """
+    try:
+        return _poi_search_cached(city_normalized, prompt_version)
+    except LookupError as e:
+        return str(e)
+
+@functools.lru_cache(maxsize=256)
+def _poi_search_cached(city_normalized: str, prompt_version: str) -> str:
+    """
+    Cached search core, keyed per (city, prompt version) with a disk-cache
+    layer underneath for repeat runs. Failures raise LookupError so
+    lru_cache only ever stores successful summaries.
+    """
+    cache_key = f"poi:{city_normalized}:{prompt_version}"
+    cached = _CACHE.get(cache_key)
+    if cached:
+        return cached
+
+    from tavily import TavilyClient
+    tavily = TavilyClient(api_key=os.getenv('TAVILY_API_KEY'))
+    if not tavily.api_key:
+         raise LookupError("TAVILY_API_KEY is missing. Cannot perform POI search.")
+
+    try:
+        query = f"Top 5 must-see tourist attractions, best restaurants, and recommended itinerary for a 7-day trip to {city_normalized}. Focus on names and descriptions."
+
+        search_result = tavily.search(query=query, search_depth='advanced', max_results=5)
+
+        # The itinerary only keeps a ~500-char summary, so truncate while
+        # accumulating instead of materializing the full multi-result
+        # concatenation (which can run to tens of KB) only to slice it
+        summaries = []
+        total = 0
+        for r in search_result['results']:
+            summaries.append(r['content'])
+            total += len(r['content'])
+            if total > _POI_SUMMARY_LIMIT:
+                break
+
+        body = "\n---\n".join(summaries)
+        if len(body) > _POI_SUMMARY_LIMIT:
+            body = body[:_POI_SUMMARY_LIMIT] + "..."
+
+        result = "Web Search Results for POIs:\n" + body
+        _CACHE.set(cache_key, result, expire=_CACHE_TTL)
+        return result
+
+    except Exception as e:
+        raise LookupError(f"Error during POI search: {e}")
 
 
 # 3. Points of Interest (POI) Search Tool
 class POISearchTool(BaseTool):
     name: str = "Points of Interest Search"
     description: str = "Searches the web for top tourist attractions, restaurants, and activities in a specific location."
-    args_schema: Type[IATALookupInput] = IATALookupInput 
-    
+    args_schema: Type[IATALookupInput] = IATALookupInput
+
     def _run(self, city_name: str) -> str:
-        tavily = TavilyClient(api_key=os.getenv('TAVILY_API_KEY'))
-        if not tavily.api_key:
-             return "TAVILY_API_KEY is missing. Cannot perform POI search."
+        return self._run_impl(city_name)
 
-        try:
-            query = f"Top 5 must-see tourist attractions, best restaurants, and recommended itinerary for a 7-day trip to {city_name}. Focus on names and descriptions."
-            
-            search_result = tavily.search(query=query, search_depth='advanced', max_results=5)
-            
-            summaries = [r['content'] for r in search_result['results']]
-            
-            return "Web Search Results for POIs:\n" + "\n---\n".join(summaries)
-        
-        except Exception as e:
-            return f"Error during POI search: {e}"
\ No newline at end of file
+    def _run_impl(self, city_name: str) -> str:
+        """Tool body, callable directly to skip the framework's args_schema validation."""
+        return _poi_search(city_name.strip().casefold(), _POI_PROMPT_VERSION)
+
+    async def _arun(self, city_name: str) -> str:
+        return await asyncio.to_thread(self._run_impl, city_name)
+
+# Shared tool instances. BaseTool construction runs LangChain's
+# Pydantic-heavy metaclass machinery, so build each tool once at import and
+# let every orchestrator reuse them; the tools hold no per-trip state.
+FLIGHT_TOOL = FlightSearchTool()
+IATA_TOOL = CityToIATATool()
+POI_TOOL = POISearchTool()